@@ -0,0 +1,53 @@
+from main import (
+    SessionLocal, WeeklyMenuDB, WeeklyMenuCompleteDB,
+    WEEK_DAY_KEYS, canonical_day_menu, calculate_weekly_totals
+)
+
+BATCH_SIZE = 200
+
+def convert_model(db, model, with_totals: bool = False):
+    """Reescribe las columnas de día de una tabla de menús al esquema canónico, por lotes"""
+    last_id = 0
+    converted = 0
+    while True:
+        menus = db.query(model).filter(model.id > last_id).order_by(model.id).limit(BATCH_SIZE).all()
+        if not menus:
+            break
+
+        for menu in menus:
+            changed = False
+            for day_key in WEEK_DAY_KEYS:
+                current = getattr(menu, day_key)
+                canonical = canonical_day_menu(current or {}, strict=False)
+                if canonical != current:
+                    setattr(menu, day_key, canonical)
+                    changed = True
+
+            if with_totals:
+                totals = calculate_weekly_totals([getattr(menu, day_key) for day_key in WEEK_DAY_KEYS])
+                for field, value in totals.items():
+                    if getattr(menu, field) != value:
+                        setattr(menu, field, value)
+                        changed = True
+
+            if changed:
+                converted += 1
+
+        db.commit()
+        last_id = menus[-1].id
+
+    print(f"  {model.__tablename__}: {converted} menús convertidos")
+    return converted
+
+def convert_all():
+    """Convierte weekly_menus y weekly_menus_complete (idempotente)"""
+    db = SessionLocal()
+    try:
+        convert_model(db, WeeklyMenuDB)
+        convert_model(db, WeeklyMenuCompleteDB, with_totals=True)
+    finally:
+        db.close()
+    print("✅ Menús en esquema canónico")
+
+if __name__ == "__main__":
+    convert_all()
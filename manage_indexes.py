@@ -0,0 +1,70 @@
+import os
+import sys
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, text
+
+# Cargar variables de entorno
+load_dotenv()
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+# Los índices los crean las migraciones (migrations/, ctx.create_index con CONCURRENTLY):
+# son la única fuente. Este script solo revisa su estado en la base desplegada.
+
+def get_engine():
+    if not DATABASE_URL:
+        print("❌ DATABASE_URL no está definida")
+        sys.exit(1)
+    return create_engine(DATABASE_URL)
+
+def check_indexes():
+    """
+    Reporta índices inválidos (build concurrente interrumpido) e índices
+    existentes que nunca se han usado (idx_scan = 0) según pg_stat_user_indexes.
+    Retorna código de salida 1 si hay algún índice inválido.
+    """
+    engine = get_engine()
+    with engine.connect() as conn:
+        invalid = conn.execute(text("""
+            SELECT c.relname AS index_name, t.relname AS table_name
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            JOIN pg_class t ON t.oid = i.indrelid
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = current_schema()
+              AND NOT i.indisvalid
+            ORDER BY c.relname
+        """)).fetchall()
+
+        # Índices sin uso, excluyendo llaves primarias y restricciones únicas
+        unused = conn.execute(text("""
+            SELECT s.relname AS table_name,
+                   s.indexrelname AS index_name,
+                   pg_size_pretty(pg_relation_size(s.indexrelid)) AS size
+            FROM pg_stat_user_indexes s
+            JOIN pg_index i ON i.indexrelid = s.indexrelid
+            WHERE s.schemaname = current_schema()
+              AND s.idx_scan = 0
+              AND NOT i.indisprimary
+              AND NOT i.indisunique
+            ORDER BY pg_relation_size(s.indexrelid) DESC
+        """)).fetchall()
+
+    for row in invalid:
+        print(f"❌ Índice inválido (build concurrente interrumpido): {row.index_name} en {row.table_name}")
+    for row in unused:
+        print(f"⚠️ Índice sin uso: {row.index_name} en {row.table_name} ({row.size})")
+
+    if not invalid:
+        print("✅ Todos los índices son válidos")
+
+    return 1 if invalid else 0
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "check"
+    if command == "check":
+        sys.exit(check_indexes())
+    else:
+        print("Uso: python manage_indexes.py [check]")
+        sys.exit(1)
@@ -0,0 +1,219 @@
+import importlib.util
+import os
+import sys
+import time
+
+from dotenv import load_dotenv
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+# Cargar variables de entorno
+load_dotenv()
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+
+# Tiempo máximo que un ALTER TABLE espera por su lock antes de reintentar,
+# para no encolar detrás de él todas las consultas de la tabla
+LOCK_TIMEOUT = os.getenv("MIGRATION_LOCK_TIMEOUT", "5s")
+LOCK_RETRIES = 5
+
+# Llave para pg_advisory_lock: evita que dos despliegues migren a la vez
+ADVISORY_LOCK_ID = 72190413
+
+class MigrationContext:
+    """
+    Operaciones disponibles para las migraciones.
+    Cada operación maneja su propia transacción para no mantener locks largos.
+
+    Las migraciones no importan main.py ni los scripts de la app: el esquema y el
+    SQL que aplican quedan escritos en el propio archivo, y una migración ya
+    publicada no se modifica (los cambios van en una migración nueva).
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def execute(self, sql: str, params: dict = None):
+        """Ejecutar una sentencia en su propia transacción"""
+        with self.engine.begin() as conn:
+            conn.execute(text(sql), params or {})
+
+    def execute_ddl(self, *statements: str):
+        """
+        Ejecutar DDL que toma un lock exclusivo breve (ADD COLUMN, RENAME, ADD CONSTRAINT ... NOT VALID).
+        Todas las sentencias van en una sola transacción con lock_timeout; si el lock
+        está ocupado se reintenta, en lugar de bloquear la tabla esperándolo.
+        """
+        for attempt in range(1, LOCK_RETRIES + 1):
+            try:
+                with self.engine.begin() as conn:
+                    conn.execute(text(f"SET LOCAL lock_timeout = '{LOCK_TIMEOUT}'"))
+                    for sql in statements:
+                        conn.execute(text(sql))
+                return
+            except OperationalError as e:
+                if "lock timeout" not in str(e) or attempt == LOCK_RETRIES:
+                    raise
+                print(f"  ⏳ Lock ocupado, reintento {attempt}/{LOCK_RETRIES}...")
+                time.sleep(attempt * 2)
+
+    def get_column_type(self, table: str, column: str):
+        """Tipo de una columna según information_schema (None si no existe)"""
+        with self.engine.connect() as conn:
+            return conn.execute(text("""
+                SELECT data_type FROM information_schema.columns
+                WHERE table_schema = current_schema() AND table_name = :table AND column_name = :column
+            """), {"table": table, "column": column}).scalar()
+
+    def add_column(self, table: str, column: str, column_type: str):
+        """Agregar una columna (nullable, sin default: solo cambia el catálogo)"""
+        print(f"  Agregando columna {table}.{column} ({column_type})")
+        self.execute_ddl(f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {column} {column_type}")
+
+    def create_index(self, name: str, table: str, columns: list, unique: bool = False, where: str = None):
+        """Crear un índice con CREATE INDEX CONCURRENTLY (sin bloquear escrituras)"""
+        cols = ", ".join(columns)
+        unique_sql = "UNIQUE " if unique else ""
+        where_sql = f" WHERE {where}" if where else ""
+
+        # CONCURRENTLY no puede ejecutarse dentro de una transacción
+        with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            is_valid = conn.execute(text("""
+                SELECT i.indisvalid
+                FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indexrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE c.relname = :name AND n.nspname = current_schema()
+            """), {"name": name}).scalar()
+
+            if is_valid is False:
+                # Un build concurrente interrumpido deja el índice inválido
+                print(f"  ⚠️ Índice {name} inválido, recreando")
+                conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+            elif is_valid:
+                print(f"  El índice {name} ya existe")
+                return
+
+            print(f"  Creando índice {name} en {table} ({cols})")
+            conn.execute(text(
+                f"CREATE {unique_sql}INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({cols}){where_sql}"
+            ))
+
+    def backfill(self, table: str, set_sql: str, where_sql: str, batch_size: int = 1000, pause: float = 0.05):
+        """
+        Actualizar filas por lotes de `batch_size`, recorriendo la tabla por id.
+        Cada lote es una transacción corta. `where_sql` debe excluir las filas ya
+        procesadas, de modo que el backfill se puede reanudar si se interrumpe.
+        """
+        last_id = 0
+        total = 0
+        while True:
+            with self.engine.begin() as conn:
+                updated_ids = conn.execute(text(f"""
+                    UPDATE {table} SET {set_sql}
+                    WHERE id IN (
+                        SELECT id FROM {table}
+                        WHERE id > :last_id AND ({where_sql})
+                        ORDER BY id
+                        LIMIT :batch_size
+                    )
+                    RETURNING id
+                """), {"last_id": last_id, "batch_size": batch_size}).scalars().all()
+
+            if not updated_ids:
+                break
+
+            last_id = max(updated_ids)
+            total += len(updated_ids)
+            print(f"  {table}: {total} filas actualizadas (id <= {last_id})")
+            time.sleep(pause)
+
+        return total
+
+def get_engine():
+    if not DATABASE_URL:
+        print("❌ DATABASE_URL no está definida")
+        sys.exit(1)
+    return create_engine(DATABASE_URL)
+
+def load_migrations():
+    """Cargar los módulos de migrations/ ordenados por versión (prefijo numérico del archivo)"""
+    migrations = []
+    for filename in sorted(os.listdir(MIGRATIONS_DIR)):
+        if not filename.endswith(".py") or not filename[0].isdigit():
+            continue
+        name = filename[:-3]
+        version = int(name.split("_", 1)[0])
+
+        spec = importlib.util.spec_from_file_location(f"migrations.{name}", os.path.join(MIGRATIONS_DIR, filename))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        migrations.append((version, name, module))
+
+    versions = [v for v, _, _ in migrations]
+    if len(versions) != len(set(versions)):
+        raise RuntimeError("Hay dos migraciones con la misma versión")
+    return migrations
+
+def ensure_migrations_table(engine):
+    with engine.begin() as conn:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS schema_migrations (
+                version INTEGER PRIMARY KEY,
+                name VARCHAR(255) NOT NULL,
+                applied_at TIMESTAMP NOT NULL DEFAULT now()
+            )
+        """))
+
+def get_applied_versions(engine):
+    with engine.connect() as conn:
+        return set(conn.execute(text("SELECT version FROM schema_migrations")).scalars().all())
+
+def run_migrations():
+    """Aplicar en orden las migraciones pendientes"""
+    engine = get_engine()
+    ensure_migrations_table(engine)
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as lock_conn:
+        lock_conn.execute(text("SELECT pg_advisory_lock(:id)"), {"id": ADVISORY_LOCK_ID})
+        try:
+            applied = get_applied_versions(engine)
+            pending = [m for m in load_migrations() if m[0] not in applied]
+
+            if not pending:
+                print("✅ Base de datos al día, no hay migraciones pendientes")
+                return
+
+            ctx = MigrationContext(engine)
+            for version, name, module in pending:
+                print(f"▶ Aplicando {name}: {getattr(module, 'description', '')}")
+                start = time.time()
+                module.upgrade(ctx)
+                with engine.begin() as conn:
+                    conn.execute(
+                        text("INSERT INTO schema_migrations (version, name) VALUES (:version, :name)"),
+                        {"version": version, "name": name}
+                    )
+                print(f"✅ {name} aplicada en {time.time() - start:.1f}s")
+        finally:
+            lock_conn.execute(text("SELECT pg_advisory_unlock(:id)"), {"id": ADVISORY_LOCK_ID})
+
+def show_status():
+    """Mostrar qué migraciones están aplicadas y cuáles pendientes"""
+    engine = get_engine()
+    ensure_migrations_table(engine)
+    applied = get_applied_versions(engine)
+    for version, name, module in load_migrations():
+        mark = "✅" if version in applied else "⏳"
+        print(f"{mark} {name} - {getattr(module, 'description', '')}")
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "upgrade"
+    if command == "upgrade":
+        run_migrations()
+    elif command == "status":
+        show_status()
+    else:
+        print("Uso: python migrate.py [upgrade|status]")
+        sys.exit(1)
@@ -0,0 +1,377 @@
+description = "Esquema base: crear las tablas de los modelos que no existan"
+
+# Esquema congelado tal como estaban los modelos de main.py al introducir las
+# migraciones; los cambios posteriores van en su propia migración. IF NOT EXISTS:
+# en bases existentes solo crea lo que falte. Los Enum sin nombre de los modelos
+# se guardan como VARCHAR (SQLAlchemy los valida en la aplicación).
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS meal_plans (
+        id SERIAL NOT NULL,
+        name VARCHAR(150) NOT NULL,
+        description TEXT,
+        calories INTEGER NOT NULL,
+        duration VARCHAR(50),
+        category VARCHAR(50),
+        color VARCHAR(20),
+        protein_target INTEGER,
+        carbs_target INTEGER,
+        fat_target INTEGER,
+        meals_per_day INTEGER,
+        is_active INTEGER,
+        created_at VARCHAR(50),
+        PRIMARY KEY (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_meal_plans_id ON meal_plans (id)",
+    """
+    CREATE TABLE IF NOT EXISTS recipes (
+        id SERIAL NOT NULL,
+        name VARCHAR(150) NOT NULL,
+        description TEXT,
+        category VARCHAR(50),
+        "prepTime" INTEGER,
+        "cookTime" INTEGER,
+        servings INTEGER,
+        calories INTEGER,
+        protein INTEGER,
+        carbs INTEGER,
+        fat INTEGER,
+        ingredients JSON,
+        instructions JSON,
+        tags JSON,
+        image VARCHAR(255),
+        "isFavorite" INTEGER,
+        PRIMARY KEY (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_recipes_id ON recipes (id)",
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id SERIAL NOT NULL,
+        nombres VARCHAR(100),
+        apellidos VARCHAR(100),
+        email VARCHAR(100),
+        password VARCHAR(255),
+        role VARCHAR(10),
+        status VARCHAR(9),
+        created_at VARCHAR(50),
+        updated_at VARCHAR(50),
+        telefono VARCHAR(20),
+        fecha_nacimiento DATE,
+        genero VARCHAR(20),
+        direccion TEXT,
+        foto_perfil VARCHAR(255),
+        altura FLOAT,
+        peso_actual FLOAT,
+        peso_objetivo FLOAT,
+        nivel_actividad VARCHAR(50),
+        alergias JSON,
+        preferencias JSON,
+        objetivos_salud TEXT,
+        condiciones_medicas TEXT,
+        alimentos_disgusto TEXT,
+        PRIMARY KEY (id),
+        UNIQUE (email)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_users_id ON users (id)",
+    """
+    CREATE TABLE IF NOT EXISTS weekly_menus_complete (
+        id SERIAL NOT NULL,
+        name VARCHAR(200) NOT NULL,
+        description TEXT,
+        category VARCHAR(100),
+        monday JSON,
+        tuesday JSON,
+        wednesday JSON,
+        thursday JSON,
+        friday JSON,
+        saturday JSON,
+        sunday JSON,
+        total_calories INTEGER,
+        avg_protein INTEGER,
+        avg_carbs INTEGER,
+        avg_fat INTEGER,
+        assigned_patients INTEGER,
+        is_active INTEGER,
+        created_at VARCHAR(50),
+        updated_at VARCHAR(50),
+        PRIMARY KEY (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_weekly_menus_complete_id ON weekly_menus_complete (id)",
+    """
+    CREATE TABLE IF NOT EXISTS achievements (
+        id SERIAL NOT NULL,
+        patient_id INTEGER,
+        title VARCHAR(255) NOT NULL,
+        description TEXT,
+        achieved_date DATE NOT NULL,
+        icon VARCHAR(50),
+        PRIMARY KEY (id),
+        FOREIGN KEY(patient_id) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_achievements_id ON achievements (id)",
+    """
+    CREATE TABLE IF NOT EXISTS admin_appearance_settings (
+        id SERIAL NOT NULL,
+        user_id INTEGER,
+        theme VARCHAR(20),
+        language VARCHAR(10),
+        date_format VARCHAR(20),
+        time_format VARCHAR(10),
+        PRIMARY KEY (id),
+        UNIQUE (user_id),
+        FOREIGN KEY(user_id) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_admin_appearance_settings_id ON admin_appearance_settings (id)",
+    """
+    CREATE TABLE IF NOT EXISTS admin_notification_settings (
+        id SERIAL NOT NULL,
+        user_id INTEGER,
+        email_appointments INTEGER,
+        email_messages INTEGER,
+        email_marketing INTEGER,
+        push_appointments INTEGER,
+        push_messages INTEGER,
+        sms_reminders INTEGER,
+        PRIMARY KEY (id),
+        UNIQUE (user_id),
+        FOREIGN KEY(user_id) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_admin_notification_settings_id ON admin_notification_settings (id)",
+    """
+    CREATE TABLE IF NOT EXISTS admin_profiles (
+        id SERIAL NOT NULL,
+        user_id INTEGER,
+        specialty VARCHAR(100),
+        license VARCHAR(50),
+        bio TEXT,
+        PRIMARY KEY (id),
+        UNIQUE (user_id),
+        FOREIGN KEY(user_id) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_admin_profiles_id ON admin_profiles (id)",
+    """
+    CREATE TABLE IF NOT EXISTS appointments (
+        id SERIAL NOT NULL,
+        patient_id INTEGER,
+        patient_name VARCHAR(200),
+        date DATE NOT NULL,
+        time VARCHAR(10) NOT NULL,
+        duration VARCHAR(20),
+        type VARCHAR(12),
+        status VARCHAR(10),
+        notes TEXT,
+        meeting_link VARCHAR(500),
+        created_at VARCHAR(50),
+        updated_at VARCHAR(50),
+        PRIMARY KEY (id),
+        FOREIGN KEY(patient_id) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_appointments_id ON appointments (id)",
+    """
+    CREATE TABLE IF NOT EXISTS custom_foods (
+        id SERIAL NOT NULL,
+        patient_id INTEGER,
+        name VARCHAR(255) NOT NULL,
+        portion_size VARCHAR(100),
+        calories INTEGER,
+        protein INTEGER,
+        carbs INTEGER,
+        fat INTEGER,
+        created_at VARCHAR(50),
+        PRIMARY KEY (id),
+        FOREIGN KEY(patient_id) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_custom_foods_id ON custom_foods (id)",
+    """
+    CREATE TABLE IF NOT EXISTS meal_tracking (
+        id SERIAL NOT NULL,
+        patient_id INTEGER,
+        date DATE,
+        meal_type VARCHAR(50),
+        meal_name VARCHAR(100),
+        calories INTEGER,
+        completed INTEGER,
+        completed_at VARCHAR(50),
+        created_at VARCHAR(50),
+        updated_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id),
+        FOREIGN KEY(patient_id) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_meal_tracking_id ON meal_tracking (id)",
+    """
+    CREATE TABLE IF NOT EXISTS messages (
+        id SERIAL NOT NULL,
+        sender_id INTEGER,
+        receiver_id INTEGER,
+        content TEXT,
+        timestamp TIMESTAMP WITHOUT TIME ZONE,
+        read BOOLEAN,
+        type VARCHAR(20),
+        PRIMARY KEY (id),
+        FOREIGN KEY(sender_id) REFERENCES users (id),
+        FOREIGN KEY(receiver_id) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_messages_id ON messages (id)",
+    """
+    CREATE TABLE IF NOT EXISTS notifications (
+        id SERIAL NOT NULL,
+        user_id INTEGER,
+        type VARCHAR(50),
+        title VARCHAR(255),
+        description TEXT,
+        read BOOLEAN,
+        created_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id),
+        FOREIGN KEY(user_id) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_notifications_id ON notifications (id)",
+    """
+    CREATE TABLE IF NOT EXISTS nutritionist_notes (
+        id SERIAL NOT NULL,
+        patient_id INTEGER,
+        note TEXT NOT NULL,
+        created_at VARCHAR(50),
+        created_by INTEGER,
+        PRIMARY KEY (id),
+        FOREIGN KEY(patient_id) REFERENCES users (id),
+        FOREIGN KEY(created_by) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_nutritionist_notes_id ON nutritionist_notes (id)",
+    """
+    CREATE TABLE IF NOT EXISTS patient_meal_plans (
+        id SERIAL NOT NULL,
+        patient_id INTEGER,
+        meal_plan_id INTEGER,
+        assigned_date VARCHAR(50),
+        start_date VARCHAR(50),
+        end_date VARCHAR(50),
+        current_week INTEGER,
+        status VARCHAR(20),
+        notes TEXT,
+        PRIMARY KEY (id),
+        FOREIGN KEY(patient_id) REFERENCES users (id),
+        FOREIGN KEY(meal_plan_id) REFERENCES meal_plans (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_patient_meal_plans_id ON patient_meal_plans (id)",
+    """
+    CREATE TABLE IF NOT EXISTS patient_progress_summaries (
+        id SERIAL NOT NULL,
+        patient_id INTEGER NOT NULL,
+        current_weight FLOAT,
+        initial_weight FLOAT,
+        trend VARCHAR(10),
+        weekly_adherence INTEGER,
+        adherence_week_start DATE,
+        last_update DATE,
+        updated_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id),
+        FOREIGN KEY(patient_id) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_patient_progress_summaries_id ON patient_progress_summaries (id)",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_patient_progress_summaries_patient_id ON patient_progress_summaries (patient_id)",
+    "CREATE INDEX IF NOT EXISTS ix_patient_progress_summaries_trend ON patient_progress_summaries (trend)",
+    """
+    CREATE TABLE IF NOT EXISTS progress_metrics (
+        id SERIAL NOT NULL,
+        patient_id INTEGER,
+        date DATE NOT NULL,
+        weight FLOAT NOT NULL,
+        body_fat FLOAT,
+        muscle FLOAT,
+        water FLOAT,
+        waist FLOAT,
+        hip FLOAT,
+        chest FLOAT,
+        arm FLOAT,
+        notes TEXT,
+        created_at VARCHAR(50),
+        PRIMARY KEY (id),
+        FOREIGN KEY(patient_id) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_progress_metrics_id ON progress_metrics (id)",
+    """
+    CREATE TABLE IF NOT EXISTS water_tracking (
+        id SERIAL NOT NULL,
+        patient_id INTEGER,
+        date DATE,
+        amount_ml INTEGER,
+        target_ml INTEGER,
+        updated_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id),
+        FOREIGN KEY(patient_id) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_water_tracking_id ON water_tracking (id)",
+    """
+    CREATE TABLE IF NOT EXISTS weekly_menus (
+        id SERIAL NOT NULL,
+        meal_plan_id INTEGER,
+        week_number INTEGER,
+        monday JSON,
+        tuesday JSON,
+        wednesday JSON,
+        thursday JSON,
+        friday JSON,
+        saturday JSON,
+        sunday JSON,
+        PRIMARY KEY (id),
+        FOREIGN KEY(meal_plan_id) REFERENCES meal_plans (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_weekly_menus_id ON weekly_menus (id)",
+    """
+    CREATE TABLE IF NOT EXISTS daily_meal_assignments (
+        id SERIAL NOT NULL,
+        patient_meal_plan_id INTEGER,
+        date DATE NOT NULL,
+        day_of_week VARCHAR(20),
+        breakfast JSON,
+        morning_snack JSON,
+        lunch JSON,
+        afternoon_snack JSON,
+        dinner JSON,
+        evening_snack JSON,
+        generated_from_menu_id INTEGER,
+        PRIMARY KEY (id),
+        FOREIGN KEY(patient_meal_plan_id) REFERENCES patient_meal_plans (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_daily_meal_assignments_id ON daily_meal_assignments (id)",
+    """
+    CREATE TABLE IF NOT EXISTS meal_food_items (
+        id SERIAL NOT NULL,
+        meal_tracking_id INTEGER,
+        name VARCHAR(100),
+        portion_size VARCHAR(100),
+        calories INTEGER,
+        protein FLOAT,
+        carbs FLOAT,
+        fat FLOAT,
+        checked INTEGER,
+        order_index INTEGER,
+        PRIMARY KEY (id),
+        FOREIGN KEY(meal_tracking_id) REFERENCES meal_tracking (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_meal_food_items_id ON meal_food_items (id)",]
+
+def upgrade(ctx):
+    ctx.execute_ddl(*SCHEMA)
@@ -0,0 +1,5 @@
+description = "Medidas corporales en progress_metrics (antes migrate_metrics.py)"
+
+def upgrade(ctx):
+    for column in ["waist", "hip", "chest", "arm"]:
+        ctx.add_column("progress_metrics", column, "FLOAT")
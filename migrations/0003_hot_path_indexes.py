@@ -0,0 +1,13 @@
+description = "Índices compuestos para los filtros frecuentes (CONCURRENTLY)"
+
+INDEXES = [
+    ("ix_patient_meal_plans_patient_status", "patient_meal_plans", ["patient_id", "status"]),
+    ("ix_meal_tracking_patient_date", "meal_tracking", ["patient_id", "date"]),
+    ("ix_daily_meal_assignments_plan_date", "daily_meal_assignments", ["patient_meal_plan_id", "date"]),
+    ("ix_appointments_date_status", "appointments", ["date", "status"]),
+    ("ix_messages_sender_receiver_timestamp", "messages", ["sender_id", "receiver_id", "timestamp"]),
+]
+
+def upgrade(ctx):
+    for name, table, columns in INDEXES:
+        ctx.create_index(name, table, columns)
@@ -0,0 +1,72 @@
+description = "Columnas de fecha nativas (TIMESTAMP/DATE) en lugar de texto, con backfill por lotes"
+
+# (tabla, columna, tipo nuevo)
+COLUMNS = [
+    ("users", "created_at", "TIMESTAMP"),
+    ("users", "updated_at", "TIMESTAMP"),
+    ("meal_plans", "created_at", "TIMESTAMP"),
+    ("patient_meal_plans", "assigned_date", "TIMESTAMP"),
+    ("patient_meal_plans", "start_date", "DATE"),
+    ("patient_meal_plans", "end_date", "DATE"),
+]
+
+INDEXES = [
+    ("ix_users_created_at", "users", ["created_at"]),
+    ("ix_meal_plans_created_at", "meal_plans", ["created_at"]),
+    ("ix_patient_meal_plans_assigned_date", "patient_meal_plans", ["assigned_date"]),
+]
+
+# Solo se convierten valores con forma de fecha ("YYYY-MM-DD", "YYYY-MM-DD HH:MM:SS",
+# "YYYY-MM-DDTHH:MM:SS.ffffff"); el resto queda en NULL y se conserva en la columna _legacy
+DATE_PATTERN = r"^\d{4}-\d{2}-\d{2}"
+
+# Conversión tolerante: un valor con forma de fecha pero inválido (2024-02-30,
+# 2024-13-01) devuelve NULL en lugar de abortar el lote entero
+CAST_FUNCTION = "migration_0004_to_timestamp"
+
+CREATE_CAST_FUNCTION = f"""
+    CREATE OR REPLACE FUNCTION {CAST_FUNCTION}(value text) RETURNS timestamp
+    LANGUAGE plpgsql IMMUTABLE AS $$
+    BEGIN
+        RETURN left(replace(value, 'T', ' '), 19)::timestamp;
+    EXCEPTION WHEN invalid_datetime_format OR datetime_field_overflow THEN
+        RETURN NULL;
+    END
+    $$
+"""
+
+def cast_expression(column: str, column_type: str) -> str:
+    return f"{CAST_FUNCTION}({column})::{column_type.lower()}"
+
+def upgrade(ctx):
+    ctx.execute(CREATE_CAST_FUNCTION)
+
+    for table, column, column_type in COLUMNS:
+        current_type = ctx.get_column_type(table, column)
+        if current_type is None or not current_type.startswith("character"):
+            # Base creada con los modelos actuales: ya es nativa
+            print(f"  {table}.{column} ya es {current_type}, nada que convertir")
+            continue
+
+        new_column = f"{column}_new"
+        pending = f"{new_column} IS NULL AND {column} ~ '{DATE_PATTERN}'"
+
+        # 1. Columna nueva (solo catálogo, sin reescribir la tabla)
+        ctx.add_column(table, new_column, column_type)
+
+        # 2. Backfill por lotes; reanudable porque solo toca filas pendientes
+        ctx.backfill(table, f"{new_column} = {cast_expression(column, column_type)}", pending)
+
+        # 3. Intercambio: ponerse al día con lo escrito durante el backfill y renombrar,
+        #    todo en una transacción corta
+        ctx.execute_ddl(
+            f"UPDATE {table} SET {new_column} = {cast_expression(column, column_type)} WHERE {pending}",
+            f"ALTER TABLE {table} RENAME COLUMN {column} TO {column}_legacy",
+            f"ALTER TABLE {table} RENAME COLUMN {new_column} TO {column}",
+        )
+        print(f"  {table}.{column} convertida a {column_type} (texto original en {column}_legacy)")
+
+    ctx.execute(f"DROP FUNCTION IF EXISTS {CAST_FUNCTION}(text)")
+
+    for name, table, columns in INDEXES:
+        ctx.create_index(name, table, columns)
@@ -0,0 +1,36 @@
+description = "Tabla daily_activity_rollups para los dashboards"
+
+# Esquema congelado aquí (no depende de los modelos actuales de main.py)
+
+CREATE_TABLE = [
+    """
+    CREATE TABLE IF NOT EXISTS daily_activity_rollups (
+        id SERIAL NOT NULL,
+        date DATE NOT NULL,
+        new_users INTEGER,
+        new_patients INTEGER,
+        new_admins INTEGER,
+        appointments INTEGER,
+        appointments_confirmadas INTEGER,
+        appointments_pendientes INTEGER,
+        appointments_canceladas INTEGER,
+        total_users INTEGER,
+        total_patients INTEGER,
+        total_admins INTEGER,
+        total_superadmins INTEGER,
+        active_users INTEGER,
+        pending_users INTEGER,
+        inactive_users INTEGER,
+        total_plans INTEGER,
+        total_appointments INTEGER,
+        avg_progress INTEGER,
+        updated_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id)
+    )
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_daily_activity_rollups_date ON daily_activity_rollups (date)",
+    "CREATE INDEX IF NOT EXISTS ix_daily_activity_rollups_id ON daily_activity_rollups (id)",
+]
+
+def upgrade(ctx):
+    ctx.execute_ddl(*CREATE_TABLE)
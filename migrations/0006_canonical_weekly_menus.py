@@ -0,0 +1,169 @@
+import json
+
+from sqlalchemy import text
+
+description = "Menús semanales en esquema canónico (conversión por lotes de los JSON existentes)"
+
+# La migración no usa los modelos ni los helpers de main.py: lee y escribe con SQL
+# solo las columnas que existen en este punto, y la conversión está congelada aquí
+# tal como era al introducir el esquema canónico.
+
+BATCH_SIZE = 200
+
+WEEK_DAY_KEYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+MEAL_TYPES = ["breakfast", "morning_snack", "lunch", "afternoon_snack", "dinner", "evening_snack"]
+
+MEAL_TYPE_LABELS = {
+    "breakfast": "desayuno",
+    "morning_snack": "almuerzo",
+    "lunch": "comida",
+    "afternoon_snack": "merienda",
+    "dinner": "cena",
+    "evening_snack": "snack"
+}
+
+SLOT_TYPE_MAPPING = {
+    **{meal_type: meal_type for meal_type in MEAL_TYPES},
+    **{label: meal_type for meal_type, label in MEAL_TYPE_LABELS.items()},
+    "snack_am": "morning_snack",
+    "snack_pm": "afternoon_snack",
+    "snack_noche": "evening_snack"
+}
+
+LEGACY_MEAL_KEYS = {
+    "breakfast": ["breakfast", "desayuno"],
+    "morning_snack": ["morning_snack", "snack_am", "media_manana", "merienda_manana"],
+    "lunch": ["lunch", "almuerzo"],
+    "afternoon_snack": ["afternoon_snack", "snack_pm", "media_tarde", "merienda_tarde"],
+    "dinner": ["dinner", "cena"],
+    "evening_snack": ["evening_snack", "snack_noche"]
+}
+
+def parse_json(value):
+    if isinstance(value, str):
+        try:
+            return json.loads(value)
+        except ValueError:
+            return {}
+    return value or {}
+
+def slot_number(data, *keys):
+    for key in keys:
+        value = data.get(key)
+        if value in (None, ""):
+            continue
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            return 0
+        return int(number) if number.is_integer() else round(number, 1)
+    return 0
+
+def canonical_slot(data, meal_type):
+    if isinstance(data, str):
+        try:
+            data = json.loads(data)
+        except ValueError:
+            data = {"recipe_name": data}
+    if not isinstance(data, dict):
+        data = {}
+
+    return {
+        "meal_type": meal_type,
+        "type": MEAL_TYPE_LABELS[meal_type],
+        "recipe_id": data.get("recipe_id"),
+        "recipe_name": data.get("recipe_name") or data.get("receta") or data.get("name") or data.get("recipe"),
+        "calories": slot_number(data, "calories", "calorias"),
+        "protein": slot_number(data, "protein", "proteina", "proteinas"),
+        "carbs": slot_number(data, "carbs", "carbohidratos"),
+        "fat": slot_number(data, "fat", "grasas"),
+        "time": data.get("time") or data.get("hora"),
+        "notes": data.get("notes") or data.get("notas"),
+        "image": data.get("image") or data.get("imagen")
+    }
+
+def canonical_day(value):
+    """Un día en cualquiera de los formatos históricos -> {"meals": [...]}; descarta lo irreconocible"""
+    day = parse_json(value)
+    if not isinstance(day, dict):
+        return {"meals": []}
+
+    slots = []
+    if isinstance(day.get("meals"), list):
+        for meal in day["meals"]:
+            if isinstance(meal, str):
+                meal = parse_json(meal)
+            if not isinstance(meal, dict):
+                continue
+            raw_type = str(meal.get("meal_type") or meal.get("type") or "").strip().lower()
+            meal_type = SLOT_TYPE_MAPPING.get(raw_type)
+            if meal_type:
+                slots.append(canonical_slot(meal, meal_type))
+    else:
+        for meal_type in MEAL_TYPES:
+            for key in LEGACY_MEAL_KEYS[meal_type]:
+                if day.get(key):
+                    slots.append(canonical_slot(day[key], meal_type))
+                    break
+
+    slots.sort(key=lambda slot: MEAL_TYPES.index(slot["meal_type"]))
+    return {"meals": slots}
+
+def weekly_totals(days):
+    """Promedio diario de calorías y macros (solo slots con receta)"""
+    totals = {"calories": 0, "protein": 0, "carbs": 0, "fat": 0}
+    for day in days:
+        for meal in day["meals"]:
+            if meal["recipe_id"] or meal["recipe_name"]:
+                for field in totals:
+                    totals[field] += meal[field]
+    return {
+        "total_calories": totals["calories"] // 7,
+        "avg_protein": totals["protein"] // 7,
+        "avg_carbs": totals["carbs"] // 7,
+        "avg_fat": totals["fat"] // 7
+    }
+
+def convert_table(ctx, table, with_totals=False):
+    """Reescribe las columnas de día de `table` al esquema canónico, por lotes (idempotente)"""
+    day_columns = ", ".join(WEEK_DAY_KEYS)
+    extra_columns = ", total_calories, avg_protein, avg_carbs, avg_fat" if with_totals else ""
+    last_id = 0
+    converted = 0
+    while True:
+        with ctx.engine.begin() as conn:
+            rows = conn.execute(text(f"""
+                SELECT id, {day_columns}{extra_columns}
+                FROM {table}
+                WHERE id > :last_id
+                ORDER BY id
+                LIMIT :batch_size
+            """), {"last_id": last_id, "batch_size": BATCH_SIZE}).mappings().all()
+            if not rows:
+                break
+
+            for row in rows:
+                days = {day_key: canonical_day(row[day_key]) for day_key in WEEK_DAY_KEYS}
+                changes = {day_key: day for day_key, day in days.items() if day != row[day_key]}
+                if with_totals:
+                    totals = weekly_totals(days.values())
+                    changes.update({field: value for field, value in totals.items() if row[field] != value})
+                if not changes:
+                    continue
+
+                params = {
+                    field: json.dumps(value) if field in WEEK_DAY_KEYS else value
+                    for field, value in changes.items()
+                }
+                assignments = ", ".join(f"{field} = :{field}" for field in params)
+                conn.execute(text(f"UPDATE {table} SET {assignments} WHERE id = :id"), {**params, "id": row["id"]})
+                converted += 1
+
+        last_id = rows[-1]["id"]
+
+    print(f"  {table}: {converted} menús convertidos")
+
+def upgrade(ctx):
+    convert_table(ctx, "weekly_menus")
+    convert_table(ctx, "weekly_menus_complete", with_totals=True)
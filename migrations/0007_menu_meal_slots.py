@@ -0,0 +1,61 @@
+description = "Tabla menu_meal_slots (slots relacionales de weekly_menus_complete) y su carga inicial"
+
+# Esquema y carga congelados aquí (no dependen de los modelos actuales de main.py)
+
+CREATE_TABLE = [
+    """
+    CREATE TABLE IF NOT EXISTS menu_meal_slots (
+        id SERIAL PRIMARY KEY,
+        menu_id INTEGER NOT NULL REFERENCES weekly_menus_complete (id) ON DELETE CASCADE,
+        day VARCHAR(10) NOT NULL,
+        day_index INTEGER NOT NULL,
+        position INTEGER,
+        meal_type VARCHAR(20) NOT NULL,
+        recipe_id INTEGER,
+        recipe_name VARCHAR(200),
+        calories FLOAT,
+        protein FLOAT,
+        carbs FLOAT,
+        fat FLOAT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_menu_meal_slots_id ON menu_meal_slots (id)",
+    "CREATE INDEX IF NOT EXISTS ix_menu_meal_slots_menu_id ON menu_meal_slots (menu_id)",
+    "CREATE INDEX IF NOT EXISTS ix_menu_meal_slots_recipe_id ON menu_meal_slots (recipe_id)",
+]
+
+# Un slot por comida del JSON canónico (0006) de cada día; solo menús que aún no
+# tienen slots, así que se puede volver a ejecutar
+BACKFILL_SQL = """
+    INSERT INTO menu_meal_slots (
+        menu_id, day, day_index, position, meal_type, recipe_id, recipe_name,
+        calories, protein, carbs, fat
+    )
+    SELECT m.id, d.day, d.day_index, (s.position - 1)::integer,
+           s.slot->>'meal_type',
+           CASE WHEN s.slot->>'recipe_id' ~ '^[0-9]+$' THEN (s.slot->>'recipe_id')::integer END,
+           s.slot->>'recipe_name',
+           coalesce((s.slot->>'calories')::float, 0),
+           coalesce((s.slot->>'protein')::float, 0),
+           coalesce((s.slot->>'carbs')::float, 0),
+           coalesce((s.slot->>'fat')::float, 0)
+    FROM weekly_menus_complete m
+    CROSS JOIN LATERAL (VALUES
+        ('monday', 0, m.monday::jsonb),
+        ('tuesday', 1, m.tuesday::jsonb),
+        ('wednesday', 2, m.wednesday::jsonb),
+        ('thursday', 3, m.thursday::jsonb),
+        ('friday', 4, m.friday::jsonb),
+        ('saturday', 5, m.saturday::jsonb),
+        ('sunday', 6, m.sunday::jsonb)
+    ) AS d (day, day_index, value)
+    CROSS JOIN LATERAL jsonb_array_elements(
+        CASE WHEN jsonb_typeof(d.value->'meals') = 'array' THEN d.value->'meals' ELSE '[]'::jsonb END
+    ) WITH ORDINALITY AS s (slot, position)
+    WHERE s.slot->>'meal_type' IS NOT NULL
+      AND NOT EXISTS (SELECT 1 FROM menu_meal_slots x WHERE x.menu_id = m.id)
+"""
+
+def upgrade(ctx):
+    ctx.execute_ddl(*CREATE_TABLE)
+    ctx.execute(BACKFILL_SQL)
@@ -0,0 +1,43 @@
+description = "Totales por día (day_totals) en weekly_menus_complete, calculados desde menu_meal_slots"
+
+# Cálculo congelado aquí (no depende de main.py): solo slots con receta; los
+# totales semanales son el promedio diario (suma / 7).
+TOTALS_SQL = """
+    WITH per_day AS (
+        SELECT s.menu_id, s.day,
+               sum(s.calories) AS calories, sum(s.protein) AS protein,
+               sum(s.carbs) AS carbs, sum(s.fat) AS fat
+        FROM menu_meal_slots s
+        WHERE s.recipe_id IS NOT NULL OR s.recipe_name IS NOT NULL
+        GROUP BY s.menu_id, s.day
+    ),
+    per_menu AS (
+        SELECT m.id AS menu_id,
+               coalesce(sum(d.calories), 0) AS calories,
+               coalesce(sum(d.protein), 0) AS protein,
+               coalesce(sum(d.carbs), 0) AS carbs,
+               coalesce(sum(d.fat), 0) AS fat,
+               coalesce(
+                   json_object_agg(
+                       d.day,
+                       json_build_object('calories', d.calories, 'protein', d.protein, 'carbs', d.carbs, 'fat', d.fat)
+                   ) FILTER (WHERE d.day IS NOT NULL),
+                   '{}'::json
+               ) AS day_totals
+        FROM weekly_menus_complete m
+        LEFT JOIN per_day d ON d.menu_id = m.id
+        GROUP BY m.id
+    )
+    UPDATE weekly_menus_complete m
+    SET total_calories = floor(p.calories / 7),
+        avg_protein = floor(p.protein / 7),
+        avg_carbs = floor(p.carbs / 7),
+        avg_fat = floor(p.fat / 7),
+        day_totals = p.day_totals
+    FROM per_menu p
+    WHERE m.id = p.menu_id
+"""
+
+def upgrade(ctx):
+    ctx.add_column("weekly_menus_complete", "day_totals", "JSON")
+    ctx.execute(TOTALS_SQL)
@@ -0,0 +1,38 @@
+description = "Calendario virtual de comidas: tramos de menú por asignación y overrides diarios"
+
+# Esquema congelado aquí (no depende de los modelos actuales de main.py)
+
+CREATE_TABLES = [
+    """
+    CREATE TABLE IF NOT EXISTS assignment_menu_segments (
+        id SERIAL NOT NULL,
+        patient_meal_plan_id INTEGER NOT NULL,
+        menu_id INTEGER NOT NULL,
+        start_date DATE NOT NULL,
+        end_date DATE,
+        created_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id),
+        FOREIGN KEY (patient_meal_plan_id) REFERENCES patient_meal_plans (id),
+        FOREIGN KEY (menu_id) REFERENCES weekly_menus_complete (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_assignment_menu_segments_id ON assignment_menu_segments (id)",
+    "CREATE INDEX IF NOT EXISTS ix_assignment_menu_segments_patient_meal_plan_id ON assignment_menu_segments (patient_meal_plan_id)",
+    """
+    CREATE TABLE IF NOT EXISTS daily_meal_overrides (
+        id SERIAL NOT NULL,
+        patient_meal_plan_id INTEGER NOT NULL,
+        date DATE NOT NULL,
+        meal_type VARCHAR(20) NOT NULL,
+        meal JSON,
+        updated_at TIMESTAMP WITHOUT TIME ZONE,
+        PRIMARY KEY (id),
+        CONSTRAINT uq_daily_meal_overrides_slot UNIQUE (patient_meal_plan_id, date, meal_type),
+        FOREIGN KEY (patient_meal_plan_id) REFERENCES patient_meal_plans (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_daily_meal_overrides_id ON daily_meal_overrides (id)",
+]
+
+def upgrade(ctx):
+    ctx.execute_ddl(*CREATE_TABLES)
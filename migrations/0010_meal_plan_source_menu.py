@@ -0,0 +1,4 @@
+description = "meal_plans.source_menu_id: plan compartido por las asignaciones directas de un menú"
+
+def upgrade(ctx):
+    ctx.add_column("meal_plans", "source_menu_id", "INTEGER")
@@ -0,0 +1,60 @@
+from sqlalchemy.exc import IntegrityError
+
+description = "Llave única (patient_id, date, meal_type) en meal_tracking, eliminando duplicados"
+
+DUPLICATES_SQL = """
+    SELECT id FROM (
+        SELECT id, row_number() OVER (
+            PARTITION BY patient_id, date, meal_type
+            ORDER BY completed DESC, id
+        ) AS rn
+        FROM meal_tracking
+    ) ranked
+    WHERE rn > 1
+"""
+
+# Adherencia de la semana actual (comidas completadas / registradas hasta hoy),
+# congelada aquí con el mismo criterio que el resumen precalculado de main.py
+ADHERENCE_SQL = """
+    UPDATE patient_progress_summaries s
+    SET weekly_adherence = coalesce((
+            SELECT floor(100.0 * count(*) FILTER (WHERE m.completed::integer <> 0) / nullif(count(*), 0))::integer
+            FROM meal_tracking m
+            WHERE m.patient_id = s.patient_id
+              AND m.date >= date_trunc('week', current_date)::date
+              AND m.date <= current_date
+        ), 0),
+        adherence_week_start = date_trunc('week', current_date)::date,
+        updated_at = now()
+"""
+
+# Si durante el build concurrente se cuelan duplicados nuevos, el índice queda
+# inválido: se vuelve a deduplicar y create_index lo recrea
+MAX_ATTEMPTS = 3
+
+def remove_duplicates(ctx):
+    """Se conserva la comida completada (o la más antigua) de cada grupo duplicado"""
+    ctx.execute(f"""
+        WITH duplicates AS ({DUPLICATES_SQL}),
+        deleted_foods AS (
+            DELETE FROM meal_food_items WHERE meal_tracking_id IN (SELECT id FROM duplicates)
+        )
+        DELETE FROM meal_tracking WHERE id IN (SELECT id FROM duplicates)
+    """)
+
+def upgrade(ctx):
+    for attempt in range(1, MAX_ATTEMPTS + 1):
+        remove_duplicates(ctx)
+        try:
+            ctx.create_index(
+                "uq_meal_tracking_patient_date_meal", "meal_tracking",
+                ["patient_id", "date", "meal_type"], unique=True
+            )
+            break
+        except IntegrityError:
+            if attempt == MAX_ATTEMPTS:
+                raise
+            print(f"  ⚠️ Duplicados nuevos durante la creación del índice, reintento {attempt}/{MAX_ATTEMPTS - 1}")
+
+    # La adherencia precalculada pudo quedar inflada por los duplicados
+    ctx.execute(ADHERENCE_SQL)
@@ -0,0 +1,22 @@
+description = "Llave única (patient_id, date) en water_tracking, fusionando duplicados"
+
+def upgrade(ctx):
+    # Los duplicados vienen de escrituras concurrentes: cada fila tiene parte de los vasos del día
+    ctx.execute("""
+        UPDATE water_tracking w
+        SET amount_ml = d.total_ml, target_ml = d.target_ml
+        FROM (
+            SELECT min(id) AS id, sum(amount_ml) AS total_ml, max(target_ml) AS target_ml
+            FROM water_tracking
+            GROUP BY patient_id, date
+            HAVING count(*) > 1
+        ) d
+        WHERE w.id = d.id
+    """)
+    ctx.execute("""
+        DELETE FROM water_tracking w
+        USING water_tracking keep
+        WHERE w.patient_id = keep.patient_id AND w.date = keep.date AND w.id > keep.id
+    """)
+
+    ctx.create_index("uq_water_tracking_patient_date", "water_tracking", ["patient_id", "date"], unique=True)
@@ -0,0 +1,10 @@
+description = "Índices para la paginación por llave de citas y notificaciones (CONCURRENTLY)"
+
+INDEXES = [
+    ("ix_appointments_date_time_id", "appointments", ["date", "time", "id"]),
+    ("ix_notifications_user_id_id", "notifications", ["user_id", "id"]),
+]
+
+def upgrade(ctx):
+    for name, table, columns in INDEXES:
+        ctx.create_index(name, table, columns)
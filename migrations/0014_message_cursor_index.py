@@ -0,0 +1,4 @@
+description = "Índice (sender_id, receiver_id, id) para el historial de mensajes por cursor (CONCURRENTLY)"
+
+def upgrade(ctx):
+    ctx.create_index("ix_messages_sender_receiver_id", "messages", ["sender_id", "receiver_id", "id"])
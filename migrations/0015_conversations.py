@@ -0,0 +1,54 @@
+description = "Tabla conversations (resumen por par para la bandeja de mensajes) y backfill"
+
+# Esquema y backfill congelados aquí (no dependen de main.py)
+
+CREATE_TABLE = [
+    """
+    CREATE TABLE IF NOT EXISTS conversations (
+        id SERIAL NOT NULL,
+        user_low_id INTEGER NOT NULL,
+        user_high_id INTEGER NOT NULL,
+        last_message_id INTEGER,
+        last_message_preview VARCHAR(200),
+        last_message_at TIMESTAMP WITHOUT TIME ZONE,
+        unread_low INTEGER NOT NULL,
+        unread_high INTEGER NOT NULL,
+        PRIMARY KEY (id),
+        CONSTRAINT uq_conversations_pair UNIQUE (user_low_id, user_high_id),
+        FOREIGN KEY (user_low_id) REFERENCES users (id),
+        FOREIGN KEY (user_high_id) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_conversations_id ON conversations (id)",
+]
+
+# Un resumen por par de usuarios desde messages; se puede volver a ejecutar
+BACKFILL_SQL = """
+    INSERT INTO conversations (
+        user_low_id, user_high_id, last_message_id, last_message_preview,
+        last_message_at, unread_low, unread_high
+    )
+    SELECT pair.low, pair.high, last.id, left(last.content, 200), last.timestamp,
+           pair.unread_low, pair.unread_high
+    FROM (
+        SELECT least(sender_id, receiver_id) AS low,
+               greatest(sender_id, receiver_id) AS high,
+               max(id) AS last_id,
+               count(*) FILTER (WHERE read = false AND receiver_id < sender_id) AS unread_low,
+               count(*) FILTER (WHERE read = false AND receiver_id > sender_id) AS unread_high
+        FROM messages
+        WHERE sender_id IS NOT NULL AND receiver_id IS NOT NULL AND sender_id <> receiver_id
+        GROUP BY 1, 2
+    ) pair
+    JOIN messages last ON last.id = pair.last_id
+    ON CONFLICT (user_low_id, user_high_id) DO UPDATE SET
+        last_message_id = EXCLUDED.last_message_id,
+        last_message_preview = EXCLUDED.last_message_preview,
+        last_message_at = EXCLUDED.last_message_at,
+        unread_low = EXCLUDED.unread_low,
+        unread_high = EXCLUDED.unread_high
+"""
+
+def upgrade(ctx):
+    ctx.execute_ddl(*CREATE_TABLE)
+    ctx.execute(BACKFILL_SQL)
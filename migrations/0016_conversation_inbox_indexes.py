@@ -0,0 +1,5 @@
+description = "Índices por participante y recencia en conversations para la bandeja de mensajes (CONCURRENTLY)"
+
+def upgrade(ctx):
+    ctx.create_index("ix_conversations_low_last_message_at", "conversations", ["user_low_id", "last_message_at"])
+    ctx.create_index("ix_conversations_high_last_message_at", "conversations", ["user_high_id", "last_message_at"])
@@ -0,0 +1,22 @@
+import sys
+from datetime import datetime, timedelta
+
+from main import SessionLocal, preinitialize_meals_for_date
+
+def preinitialize(meal_date=None):
+    """Crear el tracking de comidas de mañana (o `meal_date`) para todos los pacientes con plan activo"""
+    if meal_date is None:
+        meal_date = datetime.now().date() + timedelta(days=1)
+
+    db = SessionLocal()
+    try:
+        stats = preinitialize_meals_for_date(meal_date, db)
+    finally:
+        db.close()
+
+    print(f"✅ Comidas del {meal_date} inicializadas: {stats['patients']} pacientes, "
+          f"{stats['meals']} comidas ({stats['skipped']} omitidos)")
+
+if __name__ == "__main__":
+    meal_date = datetime.strptime(sys.argv[1], "%Y-%m-%d").date() if len(sys.argv) > 1 else None
+    preinitialize(meal_date)
@@ -0,0 +1,15 @@
+from main import SessionLocal, CONVERSATIONS_REBUILD_SQL
+
+def rebuild():
+    """Reconstruye la tabla conversations a partir de todos los mensajes"""
+    db = SessionLocal()
+    try:
+        result = db.execute(CONVERSATIONS_REBUILD_SQL)
+        db.commit()
+    finally:
+        db.close()
+
+    print(f"✅ Conversaciones reconstruidas ({result.rowcount} pares)")
+
+if __name__ == "__main__":
+    rebuild()
@@ -0,0 +1,44 @@
+from main import SessionLocal, WeeklyMenuCompleteDB, sync_menu_meal_slots, refresh_menu_totals
+
+BATCH_SIZE = 200
+
+def rebuild():
+    """Reconstruye menu_meal_slots desde el JSON de weekly_menus_complete, por lotes"""
+    db = SessionLocal()
+    last_id = 0
+    total = 0
+    try:
+        while True:
+            menus = db.query(WeeklyMenuCompleteDB).filter(
+                WeeklyMenuCompleteDB.id > last_id
+            ).order_by(WeeklyMenuCompleteDB.id).limit(BATCH_SIZE).all()
+            if not menus:
+                break
+
+            for menu in menus:
+                sync_menu_meal_slots(menu, db)
+            db.commit()
+
+            last_id = menus[-1].id
+            total += len(menus)
+            print(f"Menús sincronizados: {total}")
+    finally:
+        db.close()
+
+    print(f"✅ Slots reconstruidos ({total} menús)")
+
+def refresh_totals():
+    """Recalcula day_totals y totales semanales de todos los menús desde menu_meal_slots"""
+    db = SessionLocal()
+    try:
+        menu_ids = [row.id for row in db.query(WeeklyMenuCompleteDB.id).all()]
+        refresh_menu_totals(menu_ids, db)
+        db.commit()
+    finally:
+        db.close()
+
+    print(f"✅ Totales recalculados ({len(menu_ids)} menús)")
+
+if __name__ == "__main__":
+    rebuild()
+    refresh_totals()
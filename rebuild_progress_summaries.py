@@ -0,0 +1,34 @@
+from main import SessionLocal, UserDB, refresh_patient_progress_summary
+
+BATCH_SIZE = 200
+
+def rebuild():
+    """Reconstruye patient_progress_summaries para todos los pacientes, por lotes"""
+    db = SessionLocal()
+    last_id = 0
+    total = 0
+    try:
+        while True:
+            patient_ids = [
+                row.id for row in db.query(UserDB.id).filter(
+                    UserDB.role == "patient",
+                    UserDB.id > last_id
+                ).order_by(UserDB.id).limit(BATCH_SIZE).all()
+            ]
+            if not patient_ids:
+                break
+
+            for patient_id in patient_ids:
+                refresh_patient_progress_summary(patient_id, db)
+            db.commit()
+
+            last_id = patient_ids[-1]
+            total += len(patient_ids)
+            print(f"Resúmenes actualizados: {total}")
+    finally:
+        db.close()
+
+    print(f"✅ Reconstrucción completada ({total} pacientes)")
+
+if __name__ == "__main__":
+    rebuild()
@@ -0,0 +1,43 @@
+import sys
+from datetime import datetime, timedelta
+
+from sqlalchemy import func
+
+from main import SessionLocal, DailyActivityRollupDB, refresh_activity_rollup
+
+# En la primera ejecución se calculan los últimos 6 meses (lo que muestran los dashboards)
+INITIAL_BACKFILL_DAYS = 186
+
+def rollup(since=None):
+    """
+    Actualizar daily_activity_rollups de forma incremental:
+    desde el último día ya calculado (o `since`) hasta el fin de la semana en curso,
+    para que las citas ya agendadas de la semana también queden contadas.
+    """
+    db = SessionLocal()
+    try:
+        today = datetime.now().date()
+        week_end = today + timedelta(days=6 - today.weekday())
+
+        if since is None:
+            last_day = db.query(func.max(DailyActivityRollupDB.date)).filter(
+                DailyActivityRollupDB.date < today
+            ).scalar()
+            # Se recalcula también el último día cerrado para incluir cambios tardíos
+            since = last_day if last_day else today - timedelta(days=INITIAL_BACKFILL_DAYS)
+
+        day = since
+        total = 0
+        while day <= week_end:
+            refresh_activity_rollup(db, day)
+            db.commit()
+            day += timedelta(days=1)
+            total += 1
+
+        print(f"✅ Rollup actualizado: {total} días ({since} a {week_end})")
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    since = datetime.strptime(sys.argv[1], "%Y-%m-%d").date() if len(sys.argv) > 1 else None
+    rollup(since)
@@ -19,6 +19,7 @@ import {
   SelectValue,
 } from "@/components/ui/select";
 import { API_URL } from "@/config/api";
+import { fetchAllPages } from "@/lib/pagination";
 import { useToast } from "@/hooks/use-toast";
 import { Avatar, AvatarFallback, AvatarImage } from "@/components/ui/avatar";
 import { Search, User, Calendar, FileText } from "lucide-react";
@@ -82,7 +83,7 @@ export function AssignPlanDialog({ plan, open, onOpenChange, onAssignSuccess }:
   const fetchPatients = async () => {
     try {
       setLoadingPatients(true);
-      const response = await fetch(`${API_URL}/patients`);
+      const response = await fetchAllPages(`${API_URL}/patients`);
       if (response.ok) {
         const data = await response.json();
         setPatients(data);
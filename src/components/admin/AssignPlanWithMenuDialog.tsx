@@ -9,6 +9,7 @@ import { Calendar as CalendarIcon, ChefHat, Users } from "lucide-react";
 import { format } from "date-fns";
 import { es } from "date-fns/locale";
 import { API_URL } from "@/config/api";
+import { fetchAllPages } from "@/lib/pagination";
 import { useToast } from "@/hooks/use-toast";
 import { cn } from "@/lib/utils";
 
@@ -57,7 +58,7 @@ export function AssignPlanWithMenuDialog({ plan, open, onOpenChange, onAssignSuc
 
     const fetchPatients = async () => {
         try {
-            const response = await fetch(`${API_URL}/patients`);
+            const response = await fetchAllPages(`${API_URL}/patients`);
             if (response.ok) {
                 const data = await response.json();
                 setPatients(data);
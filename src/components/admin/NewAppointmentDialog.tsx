@@ -25,6 +25,7 @@ import { format } from "date-fns";
 import { es } from "date-fns/locale";
 import { CalendarIcon, Loader2 } from "lucide-react";
 import { API_URL } from "@/config/api";
+import { fetchAllPages } from "@/lib/pagination";
 import { useToast } from "@/hooks/use-toast";
 import axios from "axios";
 
@@ -72,8 +73,9 @@ export function NewAppointmentDialog({ children, onAppointmentCreated }: NewAppo
 
   const fetchPatients = async () => {
     try {
-      const response = await axios.get(`${API_URL}/patients`);
-      setPatients(response.data);
+      const response = await fetchAllPages(`${API_URL}/patients`);
+      if (!response.ok) throw new Error(`Error ${response.status}`);
+      setPatients(await response.json());
     } catch (error) {
       console.error("Error loading patients:", error);
       toast({
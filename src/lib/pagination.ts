@@ -0,0 +1,37 @@
+/**
+ * Los listados del backend se devuelven por páginas: cada respuesta es un arreglo
+ * y el cursor de la página siguiente viene en el header X-Next-Cursor (ausente en
+ * la última página).
+ */
+export const NEXT_CURSOR_HEADER = "X-Next-Cursor";
+
+/**
+ * Igual que fetch(), pero sigue X-Next-Cursor hasta la última página y responde
+ * con todas las filas en un solo arreglo JSON. Si alguna página falla se retorna
+ * esa respuesta tal cual, para que el llamador maneje el error como siempre.
+ */
+export async function fetchAllPages(url: string, init?: RequestInit): Promise<Response> {
+  const items: unknown[] = [];
+  let cursor: string | null = null;
+
+  do {
+    const pageUrl: string = cursor
+      ? `${url}${url.includes("?") ? "&" : "?"}cursor=${encodeURIComponent(cursor)}`
+      : url;
+    const response = await fetch(pageUrl, init);
+    if (!response.ok) return response;
+
+    const page = await response.json();
+    if (!Array.isArray(page)) {
+      // No es un listado paginado: devolver el cuerpo sin cambios
+      return new Response(JSON.stringify(page), { status: response.status, headers: response.headers });
+    }
+    items.push(...page);
+    cursor = response.headers.get(NEXT_CURSOR_HEADER);
+  } while (cursor);
+
+  return new Response(JSON.stringify(items), {
+    status: 200,
+    headers: { "Content-Type": "application/json" },
+  });
+}
@@ -1,6 +1,7 @@
 import { useState, useEffect } from "react";
 import { useNavigate } from "react-router-dom";
 import { API_URL } from "@/config/api";
+import { fetchAllPages } from "@/lib/pagination";
 import { AdminLayout } from "@/layouts/AdminLayout";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
@@ -68,8 +69,10 @@ export default function AdminCalendar() {
   const fetchAppointments = async () => {
     setLoading(true);
     try {
-      const response = await axios.get(`${API_URL}/appointments`);
-      const formattedAppointments = response.data.map((apt: any) => ({
+      const response = await fetchAllPages(`${API_URL}/appointments`);
+      if (!response.ok) throw new Error(`Error ${response.status}`);
+      const data = await response.json();
+      const formattedAppointments = data.map((apt: any) => ({
         id: apt.id,
         patientId: apt.patient_id,
         patientName: apt.patient_name,
@@ -30,6 +30,7 @@ import {
 } from "@/components/ui/dropdown-menu";
 import { Dialog, DialogContent, DialogHeader, DialogTitle } from "@/components/ui/dialog"; // Add import
 import { API_URL } from "@/config/api";
+import { NEXT_CURSOR_HEADER } from "@/lib/pagination";
 import { useToast } from "@/hooks/use-toast";
 
 interface Message {
@@ -124,6 +125,10 @@ export default function AdminMessages() {
   const [newMessage, setNewMessage] = useState("");
   const [searchQuery, setSearchQuery] = useState("");
   const messagesEndRef = useRef<HTMLDivElement>(null);
+  // Last message id received from the server for the open chat (polling cursor)
+  const lastMessageIdRef = useRef<string | null>(null);
+  const [hasOlderMessages, setHasOlderMessages] = useState(false);
+  const [loadingOlder, setLoadingOlder] = useState(false);
   const { toast } = useToast();
 
   const scrollToBottom = () => {
@@ -143,7 +148,8 @@ export default function AdminMessages() {
     if (patientId && conversations.length > 0) {
       const targetConv = conversations.find(c => c.id === patientId);
       if (targetConv) {
-        setSelectedConversation(targetConv);
+        // Keep the loaded history when the list refreshes
+        setSelectedConversation(prev => prev?.id === targetConv.id ? prev : targetConv);
       }
     }
   }, [conversations]);
@@ -151,20 +157,25 @@ export default function AdminMessages() {
   useEffect(() => {
     if (selectedConversation) {
       fetchMessages(selectedConversation.id);
-      const interval = setInterval(() => fetchMessages(selectedConversation.id), 5000); // Polling for new messages
+      const interval = setInterval(() => fetchNewMessages(selectedConversation.id), 5000); // Polling for new messages only
       return () => clearInterval(interval);
     }
   }, [selectedConversation?.id]);
 
+  // Scroll only when a newer message arrives, not when older history is prepended
+  const newestMessageId = selectedConversation?.messages[selectedConversation.messages.length - 1]?.id;
   useEffect(() => {
     scrollToBottom();
-  }, [selectedConversation?.messages]);
+  }, [newestMessageId]);
 
   const fetchConversations = async () => {
     try {
       const token = localStorage.getItem("token");
       if (!token) return;
-      const response = await fetch(`${API_URL}/messages/conversations`, {
+      // Include the linked patient (?patientId=) even before the first message
+      const patientId = new URLSearchParams(window.location.search).get("patientId");
+      const query = patientId ? `?contact_id=${encodeURIComponent(patientId)}` : "";
+      const response = await fetch(`${API_URL}/messages/conversations${query}`, {
         headers: { "Authorization": `Bearer ${token}` }
       });
       if (response.ok) {
@@ -180,22 +191,68 @@ export default function AdminMessages() {
     }
   };
 
+  const requestMessages = async (userId: string, query = "") => {
+    const token = localStorage.getItem("token");
+    if (!token) return null;
+    const response = await fetch(`${API_URL}/messages/${userId}${query}`, {
+      headers: { "Authorization": `Bearer ${token}` }
+    });
+    return response.ok ? response : null;
+  };
+
+  // Latest page of the chat; older history is loaded on demand with ?before=
   const fetchMessages = async (userId: string) => {
     try {
-      const token = localStorage.getItem("token");
-      if (!token) return;
-      const response = await fetch(`${API_URL}/messages/${userId}`, {
-        headers: { "Authorization": `Bearer ${token}` }
-      });
-      if (response.ok) {
-        const data = await response.json();
-        // Update the selected conversation with these messages
-        setSelectedConversation(prev => prev ? { ...prev, messages: data } : null);
-      }
+      lastMessageIdRef.current = null;
+      const response = await requestMessages(userId);
+      if (!response) return;
+      const data: Message[] = await response.json();
+      if (data.length > 0) lastMessageIdRef.current = data[data.length - 1].id;
+      setHasOlderMessages(response.headers.has(NEXT_CURSOR_HEADER));
+      setSelectedConversation(prev => prev && prev.id === userId ? { ...prev, messages: data } : prev);
     } catch (error) {
       console.error("Error fetching messages", error);
     }
-  }
+  };
+
+  // Polling: only the messages after the last id we already have
+  const fetchNewMessages = async (userId: string) => {
+    const lastId = lastMessageIdRef.current;
+    if (lastId === null) return fetchMessages(userId);
+    try {
+      const response = await requestMessages(userId, `?after=${encodeURIComponent(lastId)}`);
+      if (!response) return;
+      const data: Message[] = await response.json();
+      if (data.length === 0) return;
+      lastMessageIdRef.current = data[data.length - 1].id;
+      setSelectedConversation(prev => {
+        if (!prev || prev.id !== userId) return prev;
+        // Messages sent from this tab are already shown
+        const known = new Set(prev.messages.map(m => m.id));
+        return { ...prev, messages: [...prev.messages, ...data.filter(m => !known.has(m.id))] };
+      });
+    } catch (error) {
+      console.error("Error fetching new messages", error);
+    }
+  };
+
+  const fetchOlderMessages = async () => {
+    if (!selectedConversation || selectedConversation.messages.length === 0) return;
+    const userId = selectedConversation.id;
+    const oldestId = selectedConversation.messages[0].id;
+    try {
+      setLoadingOlder(true);
+      const response = await requestMessages(userId, `?before=${encodeURIComponent(oldestId)}`);
+      if (!response) return;
+      const data: Message[] = await response.json();
+      setHasOlderMessages(response.headers.has(NEXT_CURSOR_HEADER));
+      setSelectedConversation(prev => prev && prev.id === userId ? { ...prev, messages: [...data, ...prev.messages] } : prev);
+    } catch (error) {
+      console.error("Error fetching older messages", error);
+    } finally {
+      setLoadingOlder(false);
+    }
+  };
 
   const formatMessageTime = (date: Date) => {
     if (!date) return "";
@@ -316,7 +373,7 @@ export default function AdminMessages() {
                     className={`flex cursor-pointer items-start gap-3 border-b p-4 transition-colors hover:bg-muted/50 ${selectedConversation?.id === conversation.id ? "bg-muted" : ""
                       }`}
                     onClick={() => {
-                      setSelectedConversation(conversation);
+                      setSelectedConversation(prev => prev?.id === conversation.id ? prev : conversation);
                       // Mark as read
                       setConversations(prev => prev.map(conv =>
                         conv.id === conversation.id ? { ...conv, unreadCount: 0 } : conv
@@ -428,6 +485,13 @@ export default function AdminMessages() {
                 <CardContent className="flex-1 overflow-hidden p-0">
                   <ScrollArea className="h-full p-4">
                     <div className="space-y-4">
+                      {hasOlderMessages && (
+                        <div className="flex justify-center">
+                          <Button variant="ghost" size="sm" onClick={fetchOlderMessages} disabled={loadingOlder}>
+                            {loadingOlder ? "Cargando..." : "Cargar mensajes anteriores"}
+                          </Button>
+                        </div>
+                      )}
                       {selectedConversation.messages.map((message) => (
                         <div
                           key={message.id}
@@ -513,7 +577,7 @@ export default function AdminMessages() {
                   key={conv.id}
                   className="flex items-center gap-3 p-2 hover:bg-muted rounded-md cursor-pointer"
                   onClick={() => {
-                    setSelectedConversation(conv);
+                    setSelectedConversation(prev => prev?.id === conv.id ? prev : conv);
                     setNewChatOpen(false);
                   }}
                 >
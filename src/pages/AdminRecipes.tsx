@@ -11,6 +11,7 @@ import { Textarea } from "@/components/ui/textarea";
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from "@/components/ui/select";
 import { ScrollArea } from "@/components/ui/scroll-area";
 import { API_URL } from "@/config/api";
+import { fetchAllPages } from "@/lib/pagination";
 import { toast } from "sonner";
 import {
   Search, Plus, Clock, Flame, Users, ChefHat, Heart, Filter, MoreVertical,
@@ -77,7 +78,7 @@ export default function AdminRecipes() {
   const fetchRecipes = async () => {
     try {
       setLoading(true);
-      const response = await fetch(`${API_URL}/recipes`);
+      const response = await fetchAllPages(`${API_URL}/recipes`);
       if (response.ok) {
         const data = await response.json();
         setRecipes(data);
@@ -1,6 +1,7 @@
 import { useState, useEffect } from "react";
 import { useNavigate } from "react-router-dom";
 import { API_URL } from "@/config/api";
+import { fetchAllPages } from "@/lib/pagination";
 import { AdminLayout } from "@/layouts/AdminLayout";
 import { Card, CardContent } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
@@ -172,7 +173,7 @@ const AdminWeeklyMenus = () => {
             if (categoryFilter) params.append('category', categoryFilter);
             if (params.toString()) url += `?${params.toString()}`;
 
-            const response = await fetch(url);
+            const response = await fetchAllPages(url);
 
             if (!response.ok) {
                 throw new Error(`Error ${response.status}: ${response.statusText}`);
@@ -198,7 +199,7 @@ const AdminWeeklyMenus = () => {
 
     const fetchRecipes = async () => {
         try {
-            const response = await fetch(`${API_URL}/api/recipes`);
+            const response = await fetchAllPages(`${API_URL}/api/recipes`);
 
             if (!response.ok) {
                 throw new Error(`Error ${response.status}`);
@@ -1,6 +1,7 @@
 import { useState, useEffect } from "react";
 import { useNavigate, useSearchParams } from "react-router-dom";
 import { API_URL } from "@/config/api";
+import { fetchAllPages } from "@/lib/pagination";
 import { AdminLayout } from "@/layouts/AdminLayout";
 import { Input } from "@/components/ui/input";
 import { Button } from "@/components/ui/button";
@@ -82,7 +83,7 @@ const Patients = () => {
       setLoading(true);
       setError(null);
 
-      const response = await fetch(`${API_URL}/patients`, {
+      const response = await fetchAllPages(`${API_URL}/patients`, {
         method: "GET",
         headers: {
           "Content-Type": "application/json",
@@ -46,6 +46,7 @@ interface User {
 }
 
 import { API_URL } from "@/config/api";
+import { fetchAllPages } from "@/lib/pagination";
 
 export default function SuperadminUsers() {
   const [users, setUsers] = useState<User[]>([]);
@@ -76,7 +77,7 @@ export default function SuperadminUsers() {
       if (filterRole !== "all") params.append("role", filterRole);
       if (filterStatus !== "all") params.append("status", filterStatus);
 
-      const response = await fetch(`${API_URL}/superadmin/users?${params}`);
+      const response = await fetchAllPages(`${API_URL}/superadmin/users?${params}`);
       const data = await response.json();
       setUsers(data);
     } catch (error) {
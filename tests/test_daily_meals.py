@@ -0,0 +1,47 @@
+import threading
+from datetime import date
+
+CONCURRENT_REQUESTS = 8
+
+def test_concurrent_meal_overrides_keep_one_row(app_module, db, make_patient):
+    main = app_module
+    plan = main.MealPlanDB(name="Plan de prueba", calories=2000)
+    db.add(plan)
+    db.commit()
+    assignment = main.PatientMealPlanDB(
+        patient_id=make_patient(), meal_plan_id=plan.id, status="active", start_date=date(2030, 1, 6)
+    )
+    db.add(assignment)
+    db.commit()
+    day = date(2030, 1, 7)
+
+    barrier = threading.Barrier(CONCURRENT_REQUESTS)
+    errors = []
+
+    def request(n):
+        session = main.SessionLocal()
+        try:
+            barrier.wait()
+            main._save_meal_override(
+                assignment.id, day, "lunch", {"meal_type": "lunch", "recipe_name": f"Receta {n}"}, session
+            )
+        except Exception as e:
+            session.rollback()
+            errors.append(e)
+        finally:
+            session.close()
+
+    threads = [threading.Thread(target=request, args=(n,)) for n in range(CONCURRENT_REQUESTS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    overrides = db.query(main.DailyMealOverrideDB).filter(
+        main.DailyMealOverrideDB.patient_meal_plan_id == assignment.id,
+        main.DailyMealOverrideDB.date == day
+    ).all()
+    # Gana el último PUT; nunca quedan dos filas ni falla la llave única
+    assert len(overrides) == 1
+    assert overrides[0].meal["recipe_name"].startswith("Receta ")
@@ -0,0 +1,86 @@
+import threading
+from datetime import date
+
+# Varias peticiones inicializan a la vez las comidas del mismo día
+CONCURRENT_REQUESTS = 8
+
+def plan_slot(meal_type, recipe_name, calories):
+    return {
+        "meal_type": meal_type, "type": meal_type, "recipe_id": None, "recipe_name": recipe_name,
+        "calories": calories, "protein": 10, "carbs": 30, "fat": 5,
+        "time": None, "notes": None, "image": None
+    }
+
+def test_concurrent_insert_day_meals_initializes_each_meal_once(app_module, db, make_patient):
+    main = app_module
+    patient_id = make_patient()
+    day = date(2030, 1, 7)
+    day_meals = main.day_meals_by_type({"meals": [
+        plan_slot("breakfast", "Avena con fruta", 320),
+        plan_slot("lunch", "Pollo con arroz", 610),
+        plan_slot("dinner", "Pescado con ensalada", 450)
+    ]})
+
+    barrier = threading.Barrier(CONCURRENT_REQUESTS)
+    created = []
+    errors = []
+
+    def request():
+        session = main.SessionLocal()
+        try:
+            barrier.wait()
+            created.append(main.insert_day_meals([(patient_id, day, day_meals)], session))
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            errors.append(e)
+        finally:
+            session.close()
+
+    threads = [threading.Thread(target=request) for _ in range(CONCURRENT_REQUESTS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    # Exactamente una petición crea cada comida; las demás la encuentran ya creada
+    assert sum(created) == 3
+
+    tracked = db.query(main.MealTrackingDB).filter(
+        main.MealTrackingDB.patient_id == patient_id,
+        main.MealTrackingDB.date == day
+    ).all()
+    assert sorted(m.meal_type for m in tracked) == ["breakfast", "dinner", "lunch"]
+
+    foods = db.query(main.MealFoodItemDB).filter(
+        main.MealFoodItemDB.meal_tracking_id.in_([m.id for m in tracked])
+    ).all()
+    # Un alimento (la receta del plan) por comida, sin duplicados de otras peticiones
+    assert sorted(f.name for f in foods) == ["Avena con fruta", "Pescado con ensalada", "Pollo con arroz"]
+
+def test_complete_and_uncomplete_meal_refresh_weekly_adherence(app_module, db, client, make_patient):
+    main = app_module
+    patient_id = make_patient()
+    today = date.today().isoformat()
+
+    response = client.post(
+        f"/api/patient/{patient_id}/meals/complete", json={"meal_type": "breakfast", "date": today}
+    )
+    assert response.status_code == 200
+
+    summary = db.query(main.PatientProgressSummaryDB).filter(
+        main.PatientProgressSummaryDB.patient_id == patient_id
+    ).one()
+    assert summary.weekly_adherence == 100
+
+    response = client.post(
+        f"/api/patient/{patient_id}/meals/uncomplete", json={"meal_type": "breakfast", "date": today}
+    )
+    assert response.status_code == 200
+
+    db.expire_all()
+    summary = db.query(main.PatientProgressSummaryDB).filter(
+        main.PatientProgressSummaryDB.patient_id == patient_id
+    ).one()
+    assert summary.weekly_adherence == 0
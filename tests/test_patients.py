@@ -0,0 +1,62 @@
+from datetime import date
+
+def count_queries(main, call):
+    """Número de sentencias SQL que ejecuta `call()`"""
+    # Importar aquí: sin base de pruebas el módulo se recolecta aunque falten dependencias
+    from sqlalchemy import event
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(main.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        call()
+    finally:
+        event.remove(main.engine, "before_cursor_execute", before_cursor_execute)
+    return len(statements)
+
+def add_patients_with_plans(main, db, make_patient, count):
+    plan = main.MealPlanDB(name="Plan de prueba", calories=2000)
+    db.add(plan)
+    db.commit()
+    for _ in range(count):
+        patient_id = make_patient(peso_actual=80, peso_objetivo=72)
+        db.add(main.PatientMealPlanDB(
+            patient_id=patient_id, meal_plan_id=plan.id, status="active", start_date=date(2030, 1, 6)
+        ))
+    db.commit()
+
+def test_get_patients_runs_a_constant_number_of_queries(app_module, db, make_patient):
+    main = app_module
+
+    def list_patients():
+        db.expire_all()
+        return main.get_patients(response=main.Response(), cursor=None, limit=main.MAX_PAGE_SIZE, db=db)
+
+    add_patients_with_plans(main, db, make_patient, 1)
+    queries_before = count_queries(main, list_patients)
+    patients_before = len(list_patients())
+
+    add_patients_with_plans(main, db, make_patient, 10)
+    queries_after = count_queries(main, list_patients)
+    patients_after = len(list_patients())
+
+    assert patients_after == patients_before + 10
+    # Sin consultas por paciente: 10 pacientes más no agregan round trips
+    assert queries_after == queries_before
+
+def test_get_patients_pages_follow_next_cursor(app_module, db, make_patient):
+    main = app_module
+    add_patients_with_plans(main, db, make_patient, 3)
+
+    first = main.Response()
+    page = main.get_patients(response=first, cursor=None, limit=2, db=db)
+    assert len(page) == 2
+    next_cursor = first.headers["X-Next-Cursor"]
+
+    second = main.get_patients(response=main.Response(), cursor=next_cursor, limit=2, db=db)
+    # La segunda página sigue donde terminó la primera, sin repetir filas
+    assert second
+    assert {p["id"] for p in page}.isdisjoint(p["id"] for p in second)
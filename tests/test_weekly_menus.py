@@ -0,0 +1,9 @@
+def test_weekly_menu_stats_route_is_not_captured_by_menu_id(client):
+    response = client.get("/api/weekly-menus/stats")
+    assert response.status_code == 200
+    assert set(response.json()) == {"total_menus", "total_assigned_patients", "avg_calories", "total_recipes_used"}
+
+def test_weekly_menu_categories_route_is_not_captured_by_menu_id(client):
+    response = client.get("/api/weekly-menus/categories")
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)